@@ -1,18 +1,18 @@
-from algopy import UInt64, subroutine
+from algopy import UInt64, op, subroutine
 from algopy.arc4 import UInt8
 
-@subroutine
+@subroutine(inline=True)
 def max_uint8(a: UInt8, b: UInt8) -> UInt8:
-    return a if a > b else b
+    return UInt8.from_bytes(op.select_bytes(b.bytes, a.bytes, a > b))
 
-@subroutine
+@subroutine(inline=True)
 def min_uint8(a: UInt8, b: UInt8) -> UInt8:
-    return a if a < b else b
+    return UInt8.from_bytes(op.select_bytes(b.bytes, a.bytes, a < b))
 
-@subroutine
+@subroutine(inline=True)
 def max_uint64(a: UInt64, b: UInt64) -> UInt64:
-    return a if a > b else b
+    return op.select_uint64(b, a, a > b)
 
-@subroutine
+@subroutine(inline=True)
 def min_uint64(a: UInt64, b: UInt64) -> UInt64:
-    return a if a < b else b
+    return op.select_uint64(b, a, a < b)
@@ -18,12 +18,13 @@ TRIMMED_DECIMALS = 8
 
 @subroutine
 def scale(amt: UInt64, from_decimals: UInt8, to_decimals: UInt8) -> UInt64:
-    if from_decimals == to_decimals:
-        return amt
-    elif from_decimals > to_decimals:
-        return amt // (10 ** (from_decimals.as_uint64() - to_decimals.as_uint64()))
+    from_exp = from_decimals.as_uint64()
+    to_exp = to_decimals.as_uint64()
+    # equal decimals fall into the first branch as 10 ** 0 == 1
+    if from_exp >= to_exp:
+        return amt // (10 ** (from_exp - to_exp))
     else:
-        return amt * (10 ** (to_decimals.as_uint64() - from_decimals.as_uint64()))
+        return amt * (10 ** (to_exp - from_exp))
 
 @subroutine
 def trim(amt: UInt64, from_decimals: UInt8, to_decimals: UInt8) -> TrimmedAmount:
@@ -1,7 +1,6 @@
 from algopy import BoxMap, Bytes, Global, GlobalState, Txn, UInt64, gtxn, itxn, op, subroutine
 from algopy.arc4 import Address, Bool, Struct, UInt8, UInt16, UInt256, abi_call, abimethod, emit
 
-from folks_contracts.library import BytesUtils
 from folks_contracts.library.Upgradeable import Upgradeable
 from .. import constants as const, errors as err
 from ..library import TrimmedAmountLib
@@ -205,6 +204,9 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
         self._only_initialised()
         self._check_is_not_paused()
 
+        # check payment - amount is checked in _transfer subroutine
+        assert fee_payment.receiver == Global.current_application_address, err.FEE_PAYMENT_RECEIVER_UNKNOWN
+
         # find the message in the queue and ensure that sufficient time has elapsed
         can_complete, outbound_queued_transfer = self.get_outbound_queued_transfer(message_id)
         assert can_complete, err.OUTBOUND_QUEUED_TRANSFER_STILL_QUEUED
@@ -212,12 +214,13 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
         # remove transfer from the queue
         self._delete_outbound_transfer(message_id)
 
-        # skip rate limit logic and carry out transfer, also checks fee payment
+        # skip rate limit logic and carry out transfer, also checks fee payment amount
         self._transfer(
             fee_payment,
             message_id,
             outbound_queued_transfer.amount,
             outbound_queued_transfer.recipient_chain,
+            self.get_ntt_manager_peer(outbound_queued_transfer.recipient_chain).peer_contract.copy(),
             outbound_queued_transfer.recipient.copy(),
             outbound_queued_transfer.sender,
             outbound_queued_transfer.transceiver_instructions.copy(),
@@ -270,33 +273,38 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
 
     @abimethod(readonly=True)
     def ntt_manager_admin_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"NTT_MANAGER_ADMIN"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("NTT_MANAGER_ADMIN"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("6A673805BAA5DD9592EAC38EC399B828"))
 
     @abimethod(readonly=True)
     def pauser_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"PAUSER"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("PAUSER"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("539440820030C4994DB4E31B6B800DEA"))
 
     @abimethod(readonly=True)
     def unpauser_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"UNPAUSER"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("UNPAUSER"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("82B32D9AB5100DB08AEB9A0E08B422D1"))
 
     @abimethod(readonly=True)
     def get_ntt_manager_peer(self, chain_id: UInt16) -> NttManagerPeer:
-        assert chain_id in self.ntt_manager_peers, err.PEER_CHAIN_UNKNOWN
-        return self.ntt_manager_peers[chain_id]
+        ntt_manager_peer, exists = self.ntt_manager_peers.maybe(chain_id)
+        assert exists, err.PEER_CHAIN_UNKNOWN
+        return ntt_manager_peer
 
-    @subroutine
+    @subroutine(inline=True)
     def _check_is_not_paused(self) -> None:
         assert not self.is_paused, err.CONTRACT_PAUSED
 
-    @subroutine
+    @subroutine(inline=True)
     def _check_is_paused(self) -> None:
         assert self.is_paused, err.CONTRACT_NOT_PAUSED
 
     @subroutine
     def _use_message_id(self) -> MessageId:
+        # sequence is unique per contract so no need to hash
         self.message_sequence += 1
-        return MessageId.from_bytes(op.keccak256(op.itob(self.message_sequence)))
+        return MessageId.from_bytes(op.bzero(const.BYTES32_LENGTH - const.UINT64_LENGTH) + op.itob(self.message_sequence))
 
     @subroutine(inline=False)
     def _transfer_entry_point(
@@ -324,7 +332,7 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
 
         # check amount and recipient ain't zero
         assert amount, err.ZERO_AMOUNT
-        assert recipient.bytes != op.bzero(const.BYTES32_LENGTH), err.RECIPIENT_INVALID
+        assert op.bitlen(recipient.bytes), err.RECIPIENT_INVALID
 
         # also checks if known recipient chain
         ntt_manager_peer = self.get_ntt_manager_peer(recipient_chain)
@@ -355,6 +363,7 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
                 message_id,
                 trimmed_amount,
                 recipient_chain,
+                ntt_manager_peer.peer_contract.copy(),
                 recipient,
                 Address(Txn.sender),
                 transceiver_instructions,
@@ -368,19 +377,17 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
         message_id: MessageId,
         trimmed_amount: TrimmedAmount,
         recipient_chain: UInt16,
+        peer_contract: UniversalAddress,
         recipient: UniversalAddress,
         sender: Address,
         transceiver_instructions: TransceiverInstructions,
     ) -> None:
-        # also checks if known recipient chain
-        ntt_manager_peer = self.get_ntt_manager_peer(recipient_chain)
-
         # construct message by concatenating underlying bytes
         payload = (
             Bytes.from_hex(NTT_PAYLOAD_PREFIX) +
             trimmed_amount.decimals.bytes +
             op.itob(trimmed_amount.amount.as_uint64()) +
-            BytesUtils.convert_uint64_to_bytes32(self.asset_id.value).bytes +
+            op.bzero(const.BYTES32_LENGTH - const.UINT64_LENGTH) + op.itob(self.asset_id.value) +
             recipient.bytes +
             recipient_chain.bytes
         )
@@ -389,15 +396,14 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
             user_address=UniversalAddress.from_bytes(sender.bytes),
             source_address=UniversalAddress.from_bytes(Global.current_application_address.bytes),
             destination_chain_id=recipient_chain,
-            handler_address=ntt_manager_peer.peer_contract.copy(),
+            handler_address=peer_contract.copy(),
             payload=payload,
         )
 
         # call transceiver manager to send message through configured transceivers
         total_delivery_price = self._send_message(message, transceiver_instructions)
 
-        # check fee payment and if applicable, refund excess
-        assert fee_payment.receiver == Global.current_application_address, err.FEE_PAYMENT_RECEIVER_UNKNOWN
+        # check fee payment and if applicable, refund excess - receiver is checked by callers
         assert fee_payment.amount >= total_delivery_price, err.FEE_PAYMENT_AMOUNT_INSUFFICIENT
         excess_fee_payment = fee_payment.amount - total_delivery_price
         if excess_fee_payment:
@@ -425,9 +431,9 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
         index = UInt64(0)
         assert Bytes.from_hex(NTT_PAYLOAD_PREFIX) == op.extract(payload, index, const.BYTES4_LENGTH), err.PREFIX_INCORRECT
         index += const.BYTES4_LENGTH
-        from_decimals = ARC4UInt8(op.btoi(op.extract(payload, index, const.UINT8_LENGTH)))
+        from_decimals = ARC4UInt8.from_bytes(op.extract(payload, index, const.UINT8_LENGTH))
         index += const.UINT8_LENGTH
-        from_amount = ARC4UInt64(op.extract_uint64(payload, index))
+        from_amount = ARC4UInt64.from_bytes(op.extract(payload, index, const.UINT64_LENGTH))
         index += const.UINT64_LENGTH + const.BYTES32_LENGTH # skip source_token as never used
         recipient = Address(op.extract(payload, index, const.BYTES32_LENGTH))
         index += const.BYTES32_LENGTH
@@ -463,8 +469,9 @@ class NttManager(INttManager, MessageHandler, NttRateLimiter, Upgradeable):
         from_decimals = self._get_asset_decimals()
 
         trimmed_amount = TrimmedAmountLib.trim(amount, from_decimals, to_decimals)
-        new_amount = TrimmedAmountLib.untrim(trimmed_amount, from_decimals)
-        assert amount == new_amount, err.TRANSFER_AMOUNT_HAS_DUST
+        # trimming only ever scales down so there is no dust if the amount is a multiple of the scaling factor
+        factor = UInt64(10) ** (from_decimals.as_uint64() - trimmed_amount.decimals.as_uint64())
+        assert amount % factor == 0, err.TRANSFER_AMOUNT_HAS_DUST
 
         return trimmed_amount
 
@@ -1,11 +1,11 @@
-from algopy import BoxMap, Txn, Global, UInt64, op, subroutine
+from algopy import BoxMap, Bytes, Txn, Global, UInt64, op, subroutine
 from algopy.arc4 import Address, Bool, Struct, UInt16, UInt256, abimethod, emit
 from typing import Tuple
 
 from folks_contracts.library.extensions.InitialisableWithCreator import InitialisableWithCreator
 from folks_contracts.library.AccessControl import AccessControl
 from folks_contracts.library.RateLimiter import RateLimiter
-from .. import constants as const, errors as err
+from .. import errors as err
 from ..types import (
     ARC4UInt16,
     ARC4UInt64,
@@ -146,8 +146,8 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
             Tuple of whether the transfer can be completed and the details of the transfer request.
         """
         # check if transfer exists
-        self._check_outbound_queued_transfer_known(message_id)
-        outbound_queued_transfer = self.outbound_queued_transfers[message_id].copy()
+        outbound_queued_transfer, exists = self.outbound_queued_transfers.maybe(message_id)
+        assert exists, err.OUTBOUND_QUEUED_TRANSFER_UNKNOWN
 
         # include whether sufficient time has passed
         delta = Global.latest_timestamp - outbound_queued_transfer.timestamp.as_uint64()
@@ -175,8 +175,8 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
             Tuple of whether the transfer can be completed and the details of the transfer request.
         """
         # check if transfer exists
-        self._check_inbound_queued_transfer_known(message_digest)
-        inbound_queued_transfer = self.inbound_queued_transfers[message_digest]
+        inbound_queued_transfer, exists = self.inbound_queued_transfers.maybe(message_digest)
+        assert exists, err.INBOUND_QUEUED_TRANSFER_UNKNOWN
 
         # include whether sufficient time has passed
         delta = Global.latest_timestamp - inbound_queued_transfer.timestamp.as_uint64()
@@ -190,11 +190,13 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
 
     @abimethod(readonly=True)
     def outbound_bucket_id(self) -> Bytes32:
-        return Bytes32.from_bytes(op.keccak256(b"OUTBOUND"))
+        # keccak256("OUTBOUND"), precomputed to avoid hashing on every transfer
+        return Bytes32.from_bytes(Bytes.from_hex("D46EC3B8BD544FBDD2A1AAB0DDE7F3078A66688F3852ED050BDD79AD6BAD639B"))
 
     @abimethod(readonly=True)
     def rate_limiter_manager_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"RATE_LIMITER_MANAGER"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("RATE_LIMITER_MANAGER"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("BAFC6CE92D46433FC5B82A973719E986"))
 
     @subroutine(inline=False)
     def _enqueue_or_consume_outbound_transfer(
@@ -276,7 +278,8 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
             Whether the transfer was queued or not
         """
         # check rate limit
-        has_capacity = self.has_capacity(self.inbound_bucket_id(source_chain), UInt256(untrimmed_amount))
+        inbound_bucket_id = self.inbound_bucket_id(source_chain)
+        has_capacity = self.has_capacity(inbound_bucket_id, UInt256(untrimmed_amount))
 
         # enqueue if needed
         if not has_capacity:
@@ -299,7 +302,7 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
             return Bool(True)
 
         # otherwise consume and backfill amount
-        self._consume_amount(self.inbound_bucket_id(source_chain), UInt256(untrimmed_amount))
+        self._consume_amount(inbound_bucket_id, UInt256(untrimmed_amount))
         self._fill_amount(self.outbound_bucket_id(), UInt256(untrimmed_amount))
         return Bool(False)
 
@@ -310,8 +313,9 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
          Args:
              message_id: The Ntt defined identifier for a message to send
          """
-        self._check_outbound_queued_transfer_known(message_id)
-        del self.outbound_queued_transfers[message_id]
+        # box_del returns whether the box existed so checks and deletes in one go
+        deleted = op.Box.delete(self.outbound_queued_transfers.key_prefix + message_id.bytes)
+        assert deleted, err.OUTBOUND_QUEUED_TRANSFER_UNKNOWN
         emit(OutboundTransferDeleted(message_id))
 
     @subroutine
@@ -321,14 +325,7 @@ class NttRateLimiter(RateLimiter, AccessControl, InitialisableWithCreator):
          Args:
              message_digest: Unique identifier of the message received.
          """
-        self._check_inbound_queued_transfer_known(message_digest)
-        del self.inbound_queued_transfers[message_digest]
+        # box_del returns whether the box existed so checks and deletes in one go
+        deleted = op.Box.delete(self.inbound_queued_transfers.key_prefix + message_digest.bytes)
+        assert deleted, err.INBOUND_QUEUED_TRANSFER_UNKNOWN
         emit(InboundTransferDeleted(message_digest))
-
-    @subroutine
-    def _check_outbound_queued_transfer_known(self, message_id: MessageId) -> None:
-        assert message_id in self.outbound_queued_transfers, err.OUTBOUND_QUEUED_TRANSFER_UNKNOWN
-
-    @subroutine
-    def _check_inbound_queued_transfer_known(self, message_digest: MessageDigest) -> None:
-        assert message_digest in self.inbound_queued_transfers, err.INBOUND_QUEUED_TRANSFER_UNKNOWN
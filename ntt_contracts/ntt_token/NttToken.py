@@ -1,10 +1,9 @@
 from abc import ABC
-from algopy import Account, GlobalState, UInt64, itxn, op
+from algopy import Account, Bytes, GlobalState, UInt64, itxn
 from algopy.arc4 import Address, abimethod, emit
 
 from folks_contracts.library.extensions.InitialisableWithCreator import InitialisableWithCreator
 from folks_contracts.library.Upgradeable import Upgradeable
-from .. import constants as const
 from ..types import ARC4UInt64, Bytes16
 from .interfaces.INttToken import Minted, INttToken
 
@@ -43,4 +42,5 @@ class NttToken(INttToken, Upgradeable, InitialisableWithCreator, ABC):
 
     @abimethod(readonly=True)
     def minter_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"MINTER"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("MINTER"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("F0887BA65EE2024EA881D91B74C2450E"))
@@ -35,5 +35,6 @@ class NttTokenNew(NttToken):
         ).submit()
 
         # set new asset
-        self.asset_id.value = asset_txn.created_asset.id
-        return self.asset_id.value
+        asset_id = asset_txn.created_asset.id
+        self.asset_id.value = asset_id
+        return asset_id
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from algopy import ARC4Contract, BoxMap, Global, GlobalState, UInt64, itxn, op, subroutine
+from algopy import ARC4Contract, BoxMap, Bytes, Global, GlobalState, UInt64, itxn, op, subroutine
 from algopy.arc4 import Address, Bool, Struct, abi_call, abimethod, emit
 
 from .. import errors as err
@@ -25,8 +25,8 @@ class MessageHandler(ARC4Contract, ABC):
         self.transceiver_manager = GlobalState(UInt64)
         self.threshold = GlobalState(UInt64)
 
-        # message digest -> whether it has been executed
-        self.messages_executed = BoxMap(MessageDigest, Bool, key_prefix=b"messages_executed_")
+        # message digest -> empty, presence indicates it has been executed
+        self.messages_executed = BoxMap(MessageDigest, Bytes, key_prefix=b"messages_executed_")
 
     @abimethod(create="require")
     def create(self, threshold: UInt64) -> None:
@@ -36,6 +36,10 @@ class MessageHandler(ARC4Contract, ABC):
     def execute_message(self, message: MessageReceived) -> None:
         """Execute a message once the threshold number of attestations has been reached.
 
+        Note that this relies on the transceiver manager implementing `calculate_digest_and_attestations`. A message
+        handler upgraded to this version must point to a transceiver manager which supports it, otherwise every
+        message execution fails.
+
         Args:
             message: The message to execute
 
@@ -43,23 +47,23 @@ class MessageHandler(ARC4Contract, ABC):
             AssertionError: If the message hasn't been approved
             AssertionError: If the message has already been executed
         """
-        # calculate unique id for message to check for replay attacks
-        message_digest, txn = abi_call(
-            ITransceiverManager.calculate_message_digest,
+        # check if handler is correct, before making any inner call
+        assert Address(message.handler_address.bytes) == Global.current_application_address, err.MESSAGE_HANDLER_ADDRESS_MISMATCH
+
+        # calculate unique id for message to check for replay attacks, and retrieve its attestations in the same call
+        (message_digest, message_attestations), txn = abi_call(
+            ITransceiverManager.calculate_digest_and_attestations,
             message,
             app_id=self.transceiver_manager.value,
             fee=0,
         )
 
-        # check if handler is correct
-        assert Address(message.handler_address.bytes) == Global.current_application_address, err.MESSAGE_HANDLER_ADDRESS_MISMATCH
+        # check if required attestations have been met, threshold is never zero so there is at least one attestation
+        assert message_attestations >= self.threshold.value, err.MESSAGE_NOT_APPROVED
 
-        # check if required attestations have been met
-        assert self.is_message_approved(message_digest), err.MESSAGE_NOT_APPROVED
-
-        # protect against replay attacks
-        assert not self.is_message_executed(message_digest), err.MESSAGE_ALREADY_EXECUTED
-        self.messages_executed[message_digest] = Bool(True)
+        # protect against replay attacks, box is only created if message has not yet been executed
+        was_created = op.Box.create(self.messages_executed.key_prefix + message_digest.bytes, 0)
+        assert was_created, err.MESSAGE_ALREADY_EXECUTED
 
         # handle message
         self._handle_message(message_digest, message)
@@ -77,7 +81,8 @@ class MessageHandler(ARC4Contract, ABC):
             app_id=self.transceiver_manager.value,
             fee=0,
         )
-        return Bool(message_attestations > 0 and message_attestations >= self.threshold.value)
+        # threshold is never zero so also checks there is at least one attestation
+        return Bool(message_attestations >= self.threshold.value)
 
     @abimethod(readonly=True)
     def is_message_executed(self, message_digest: MessageDigest) -> Bool:
@@ -88,7 +93,7 @@ class MessageHandler(ARC4Contract, ABC):
         Args:
             message_digest: The message digest
         """
-        return Bool(message_digest in self.messages_executed) and self.messages_executed[message_digest]
+        return Bool(message_digest in self.messages_executed)
 
     @subroutine
     def _set_transceiver_manager(self, admin_in_transceiver_manager: Address, transceiver_manager: UInt64) -> None:
@@ -131,7 +136,7 @@ class MessageHandler(ARC4Contract, ABC):
         self.threshold.value = new_threshold
         emit(ThresholdUpdated(ARC4UInt64(new_threshold)))
 
-    @subroutine(inline=False)
+    @subroutine(inline=True)
     def _send_message(self, message: MessageToSend, transceiver_instructions: TransceiverInstructions) -> UInt64:
         """Send a message through the configured transceivers in the TransceiverManager. Takes ALGO payment from the
         application address to pay for the delivery.
@@ -144,6 +149,8 @@ class MessageHandler(ARC4Contract, ABC):
         Returns:
             Total delivery price paid in ALGO
         """
+        # read once as used in both calls and the address lookup
+        transceiver_manager = self.transceiver_manager.value
 
         # quote total delivery price
         total_delivery_price, txn = abi_call(
@@ -151,19 +158,19 @@ class MessageHandler(ARC4Contract, ABC):
             Global.current_application_id.id,
             message,
             transceiver_instructions,
-            app_id=self.transceiver_manager.value,
+            app_id=transceiver_manager,
             fee=0,
         )
 
         # send message
-        transceiver_manager_address, exists = op.AppParamsGet.app_address(self.transceiver_manager.value)
+        transceiver_manager_address, exists = op.AppParamsGet.app_address(transceiver_manager)
         assert exists, err.TRANSCEIVER_MANAGER_ADDRESS_UNKNOWN
         abi_call(
             ITransceiverManager.send_message_to_transceivers,
             itxn.Payment(amount=total_delivery_price, receiver=transceiver_manager_address, fee=0),
             message,
             transceiver_instructions,
-            app_id=self.transceiver_manager.value,
+            app_id=transceiver_manager,
             fee=0,
         )
 
@@ -48,10 +48,11 @@ class Transceiver(ITransceiver, Upgradeable, ABC):
 
         # check payment
         assert fee_payment.receiver == Global.current_application_address, err.FEE_PAYMENT_RECEIVER_UNKNOWN
-        assert fee_payment.amount == self._quote_delivery_price(message, transceiver_instruction), err.FEE_PAYMENT_AMOUNT_INCORRECT
+        delivery_price = self._quote_delivery_price(message, transceiver_instruction)
+        assert fee_payment.amount == delivery_price, err.FEE_PAYMENT_AMOUNT_INCORRECT
 
-        # send message according to concrete transceiver implementation
-        self._send_message(fee_payment.amount, message, transceiver_instruction)
+        # send message according to concrete transceiver implementation, passing the quote so it isn't recomputed
+        self._send_message(delivery_price, message, transceiver_instruction)
 
         # emit event
         emit(MessageSent(message.id))
@@ -92,6 +93,9 @@ class Transceiver(ITransceiver, Upgradeable, ABC):
         """Abstract internal method called by the `send_message` method. Namely, should implement the logic to send a
         message through the respective GMP used by the concrete Transceiver.
 
+        The caller has already checked that `total_fee` equals the delivery price returned by `_quote_delivery_price`,
+        so implementations should use it directly rather than quoting again.
+
         Args:
             total_fee: The total amount of ALGO paid to cover the fees
             message: The message to send
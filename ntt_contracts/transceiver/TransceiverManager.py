@@ -1,5 +1,6 @@
-from algopy import BoxMap, Global, Txn, UInt64, gtxn, itxn, op, subroutine, uenumerate
+from algopy import BoxMap, Bytes, Global, Txn, UInt64, gtxn, itxn, op, subroutine, urange
 from algopy.arc4 import Address, Bool, DynamicArray, DynamicBytes, Struct, UInt256, abi_call, abimethod, emit
+from typing import Tuple
 
 from folks_contracts.library import BytesUtils, UInt64SetLib
 from folks_contracts.library.AccessControl import AccessControl
@@ -28,12 +29,6 @@ from .interfaces.ITransceiverManager import (
 MAX_NUM_TRANSCEIVERS = 32
 
 
-# Structs
-class TransceiverAttestationKey(Struct):
-    message_digest: MessageDigest
-    transceiver: ARC4UInt64 # app id
-
-
 # Events
 class Paused(Struct):
     message_handler: ARC4UInt64
@@ -44,15 +39,13 @@ class TransceiverManager(ITransceiverManager, AccessControl):
     def __init__(self) -> None:
         AccessControl.__init__(self)
 
-        self.max_transceivers = UInt64(MAX_NUM_TRANSCEIVERS)
-
         # message handler -> whether is paused
         self.handler_paused = BoxMap(UInt64, Bool, key_prefix=b"handler_paused_")
         # message handler -> configured transceivers
         self.handler_transceivers = BoxMap(UInt64, DynamicArray[ARC4UInt64], key_prefix=b"handler_transceivers_")
 
-        # (message digest, transceiver) -> whether transceiver has attested to message
-        self.transceiver_attestations = BoxMap(TransceiverAttestationKey, Bool, key_prefix=b"attestations_")
+        # message digest || transceiver app id -> empty, box exists if transceiver has attested to message
+        self.transceiver_attestations = BoxMap(Bytes, Bytes, key_prefix=b"attestations_")
         # message digest -> number of attestations for message
         self.num_attestations = BoxMap(MessageDigest, UInt64, key_prefix=b"num_attestations_")
 
@@ -112,12 +105,12 @@ class TransceiverManager(ITransceiverManager, AccessControl):
 
     @abimethod
     def add_transceiver(self, message_handler: UInt64, transceiver: UInt64) -> None:
-        self._check_message_handler_known(message_handler)
+        # also checks if message handler is known
+        old_transceivers = self._get_handler_transceivers(message_handler)
         self._check_sender_role(self.message_handler_admin_role(message_handler))
 
         # ensure not going above maximum
-        old_transceivers = self.handler_transceivers[message_handler].copy()
-        assert old_transceivers.length < self.max_transceivers, err.MAX_TRANSCEIVERS_EXCEEDED
+        assert old_transceivers.length < MAX_NUM_TRANSCEIVERS, err.MAX_TRANSCEIVERS_EXCEEDED
 
         # ensure transceiver not already added
         was_added, new_transceivers = UInt64SetLib.add_item(transceiver, old_transceivers)
@@ -129,11 +122,11 @@ class TransceiverManager(ITransceiverManager, AccessControl):
 
     @abimethod
     def remove_transceiver(self, message_handler: UInt64, transceiver: UInt64) -> None:
-        self._check_message_handler_known(message_handler)
+        # also checks if message handler is known
+        old_transceivers = self._get_handler_transceivers(message_handler)
         self._check_sender_role(self.message_handler_admin_role(message_handler))
 
         # ensure transceiver was added
-        old_transceivers = self.handler_transceivers[message_handler].copy()
         was_removed, new_transceivers = UInt64SetLib.remove_item(transceiver, old_transceivers)
         assert was_removed, err.TRANSCEIVER_UNKNOWN
 
@@ -143,8 +136,7 @@ class TransceiverManager(ITransceiverManager, AccessControl):
 
     @abimethod(readonly=True)
     def get_handler_transceivers(self, message_handler: UInt64) -> DynamicArray[ARC4UInt64]:
-        self._check_message_handler_known(message_handler)
-        return self.handler_transceivers[message_handler]
+        return self._get_handler_transceivers(message_handler)
 
     @abimethod(readonly=True)
     def quote_delivery_prices(
@@ -153,10 +145,17 @@ class TransceiverManager(ITransceiverManager, AccessControl):
         message: MessageToSend,
         transceiver_instructions: TransceiverInstructions,
     ) -> UInt64:
-        self._check_message_handler_known(message_handler)
+        # also checks if message handler is known
+        transceivers = self._get_handler_transceivers(message_handler)
 
         # get total delivery quote without sending message
-        return self._quote_and_maybe_send_message(message_handler, message, transceiver_instructions, Bool(False))
+        return self._quote_and_maybe_send_message(
+            message_handler,
+            transceivers,
+            message,
+            transceiver_instructions,
+            Bool(False)
+        )
 
     @abimethod
     def send_message_to_transceivers(
@@ -168,7 +167,7 @@ class TransceiverManager(ITransceiverManager, AccessControl):
         # check message handler caller
         message_handler = Global.caller_application_id
         assert message_handler, err.APPLICATION_CALLER
-        self._check_message_handler_known(message_handler)
+        transceivers = self._get_handler_transceivers(message_handler)
         self._check_message_handler_not_paused(message_handler)
 
         # check message source address matches caller
@@ -177,6 +176,7 @@ class TransceiverManager(ITransceiverManager, AccessControl):
         # get total delivery quote and send message through each transceiver
         total_delivery_price = self._quote_and_maybe_send_message(
             message_handler,
+            transceivers,
             message,
             transceiver_instructions,
             Bool(True)
@@ -200,10 +200,10 @@ class TransceiverManager(ITransceiverManager, AccessControl):
         message_digest = self.calculate_message_digest(message)
         num_attestations = self.message_attestations(message_digest)
 
-        # protect against replay attacks
-        assert not self.has_transceiver_attested(message_digest, transceiver), err.ATTESTATION_ALREADY_RECEIVED
-        transceiver_attestation_key = self._transceiver_attestation_key(message_digest, transceiver)
-        self.transceiver_attestations[transceiver_attestation_key] = Bool(True)
+        # protect against replay attacks, box is only created if transceiver has not yet attested
+        transceiver_attestation_key = message_digest.bytes + op.itob(transceiver)
+        was_created = op.Box.create(self.transceiver_attestations.key_prefix + transceiver_attestation_key, 0)
+        assert was_created, err.ATTESTATION_ALREADY_RECEIVED
 
         # increment number of attestations received
         new_num_attestations = num_attestations + 1
@@ -219,12 +219,12 @@ class TransceiverManager(ITransceiverManager, AccessControl):
 
     @abimethod(readonly=True)
     def message_attestations(self, message_digest: MessageDigest) -> UInt64:
-        return self.num_attestations[message_digest] if message_digest in self.num_attestations else UInt64(0)
+        return self.num_attestations.get(message_digest, default=UInt64(0))
 
     @abimethod(readonly=True)
     def has_transceiver_attested(self, message_digest: MessageDigest, transceiver: UInt64) -> Bool:
-        transceiver_attestation_key = self._transceiver_attestation_key(message_digest, transceiver)
-        return Bool(transceiver_attestation_key in self.transceiver_attestations) and self.transceiver_attestations[transceiver_attestation_key]
+        transceiver_attestation_key = message_digest.bytes + op.itob(transceiver)
+        return Bool(transceiver_attestation_key in self.transceiver_attestations)
 
     @abimethod(readonly=True)
     def calculate_message_digest(self, message: MessageReceived) -> MessageDigest:
@@ -237,6 +237,11 @@ class TransceiverManager(ITransceiverManager, AccessControl):
             message.payload
         ))
 
+    @abimethod(readonly=True)
+    def calculate_digest_and_attestations(self, message: MessageReceived) -> Tuple[MessageDigest, UInt64]:
+        message_digest = self.calculate_message_digest(message)
+        return message_digest, self.message_attestations(message_digest)
+
     @abimethod(readonly=True)
     def message_handler_admin_role(self, message_handler: UInt64) -> Bytes16:
         """Returns the role identifier for the given message handler's admin role
@@ -282,24 +287,18 @@ class TransceiverManager(ITransceiverManager, AccessControl):
 
     @abimethod(readonly=True)
     def is_message_handler_paused(self, message_handler: UInt64) -> Bool:
-        return Bool(message_handler in self.handler_paused) and self.handler_paused[message_handler]
+        return self.handler_paused.get(message_handler, default=Bool(False))
 
     @abimethod(readonly=True)
     def is_transceiver_configured(self, message_handler: UInt64, transceiver: UInt64) -> Bool:
-        self._check_message_handler_known(message_handler)
-        return UInt64SetLib.has_item(transceiver, self.handler_transceivers[message_handler].copy())
+        # also checks if message handler is known
+        return UInt64SetLib.has_item(transceiver, self._get_handler_transceivers(message_handler))
 
     @subroutine
-    def _transceiver_attestation_key(
-        self,
-        message_digest: MessageDigest,
-        transceiver: UInt64
-    ) -> TransceiverAttestationKey:
-        return TransceiverAttestationKey(message_digest.copy(), ARC4UInt64(transceiver))
-
-    @subroutine
-    def _check_message_handler_known(self, message_handler: UInt64) -> None:
-        assert self.is_message_handler_known(message_handler), err.MESSAGE_HANDLER_UNKNOWN
+    def _get_handler_transceivers(self, message_handler: UInt64) -> DynamicArray[ARC4UInt64]:
+        transceivers, exists = self.handler_transceivers.maybe(message_handler)
+        assert exists, err.MESSAGE_HANDLER_UNKNOWN
+        return transceivers
 
     @subroutine
     def _check_message_handler_not_paused(self, message_handler: UInt64) -> None:
@@ -317,6 +316,7 @@ class TransceiverManager(ITransceiverManager, AccessControl):
     def _quote_and_maybe_send_message(
         self,
         message_handler: UInt64,
+        transceivers: DynamicArray[ARC4UInt64],
         message: MessageToSend,
         transceiver_instructions: TransceiverInstructions,
         should_send: Bool
@@ -324,17 +324,22 @@ class TransceiverManager(ITransceiverManager, AccessControl):
         total_delivery_price = UInt64(0)
 
         # must have at least 1 transceiver
-        transceivers = self.handler_transceivers[message_handler].copy()
         assert transceivers.length, err.MESSAGE_HANDLER_HAS_ZERO_TRANSCEIVERS
 
+        # encode once for the per transceiver event
+        message_handler_arc4 = ARC4UInt64(message_handler)
+
         # iterate through each transceiver, getting quote and possibly sending
         index_into_transceiver_instructions = UInt64(0)
-        for idx, transceiver in uenumerate(transceivers):
+        for idx in urange(transceivers.length):
+            # read directly from the array encoding: uint16 length prefix followed by the uint64 app ids
+            transceiver = op.extract_uint64(transceivers.bytes, const.UINT16_LENGTH + idx * const.UINT64_LENGTH)
+
             # the instructions passed need to be in same order as configured transceivers array
             instruction = DynamicBytes()
             if index_into_transceiver_instructions < transceiver_instructions.length:
                 transceiver_instruction = transceiver_instructions[index_into_transceiver_instructions].copy()
-                if transceiver_instruction.transceiver == transceiver:
+                if transceiver_instruction.transceiver.as_uint64() == transceiver:
                     instruction = transceiver_instruction.instruction.copy()
                     index_into_transceiver_instructions += 1
 
@@ -343,24 +348,24 @@ class TransceiverManager(ITransceiverManager, AccessControl):
                 ITransceiver.quote_delivery_price,
                 message,
                 instruction,
-                app_id=transceiver.as_uint64(),
+                app_id=transceiver,
                 fee=0,
             )
             total_delivery_price += delivery_price
 
             # if specified, send message
             if should_send:
-                transceiver_address, exists = op.AppParamsGet.app_address(transceiver.as_uint64())
+                transceiver_address, exists = op.AppParamsGet.app_address(transceiver)
                 assert exists, err.TRANSCEIVER_ADDRESS_UNKNOWN
                 abi_call(
                     ITransceiver.send_message,
                     itxn.Payment(amount=delivery_price, receiver=transceiver_address, fee=0),
                     message,
                     instruction,
-                    app_id=transceiver.as_uint64(),
+                    app_id=transceiver,
                     fee=0,
                 )
-                emit(MessageSent(ARC4UInt64(message_handler), transceiver, message.id))
+                emit(MessageSent(message_handler_arc4, ARC4UInt64(transceiver), message.id))
 
         # ensure entire transceiver instructions consumed
         assert index_into_transceiver_instructions == transceiver_instructions.length, err.INSTRUCTIONS_INVALID
@@ -1,4 +1,4 @@
-from algopy import Account, BoxMap, Bytes, GlobalState, Global, OnCompleteAction, String, UInt64, itxn, gtxn, op, subroutine
+from algopy import BoxMap, Bytes, GlobalState, Global, OnCompleteAction, String, UInt64, itxn, gtxn, op, subroutine
 from algopy.arc4 import Address, Bool, Struct, UInt16, abimethod, emit
 
 from folks_contracts.library.extensions.InitialisableWithCreator import InitialisableWithCreator
@@ -102,28 +102,31 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
         assert verify_vaa.on_completion == OnCompleteAction.NoOp, err.APP_CALL_ON_COMPLETION_INCORRECT
         assert verify_vaa.app_args(0) == Bytes(b"verifyVAA"), err.APP_CALL_METHOD_INCORRECT
 
+        vaa = verify_vaa.app_args(1)
+        vaa_length = vaa.length
+
         # header
         index = UInt64(const.BYTE_LENGTH + const.UINT32_LENGTH) # skip version and guardian_set_index
-        num_sigs = op.btoi(op.extract(verify_vaa.app_args(1), index, const.UINT8_LENGTH))
+        num_sigs = op.btoi(op.extract(vaa, index, const.UINT8_LENGTH))
         index += const.UINT8_LENGTH + num_sigs * SIGNATURE_LENGTH # skip signatures
 
-        # body
-        vaa_digest = VaaDigest.from_bytes(
-            op.keccak256(op.keccak256(op.substring(verify_vaa.app_args(1), index, verify_vaa.app_args(1).length)))
-        )
-        index += const.UINT32_LENGTH + const.UINT32_LENGTH # skip timestamp and nonce
-        emitter_chain_id = UInt16(op.extract_uint16(verify_vaa.app_args(1), index))
+        # body, sliced once and used for both the digest and the remaining fields
+        vaa_body = op.substring(vaa, index, vaa_length)
+        vaa_digest = VaaDigest.from_bytes(op.keccak256(op.keccak256(vaa_body)))
+        index = UInt64(const.UINT32_LENGTH + const.UINT32_LENGTH) # skip timestamp and nonce
+        emitter_chain_id = UInt16(op.extract_uint16(vaa_body, index))
         index += const.UINT16_LENGTH
-        emitter_address = UniversalAddress.from_bytes(op.extract(verify_vaa.app_args(1), index, const.BYTES32_LENGTH))
+        emitter_address = UniversalAddress.from_bytes(op.extract(vaa_body, index, const.BYTES32_LENGTH))
         index += const.BYTES32_LENGTH + const.UINT64_LENGTH + const.UINT8_LENGTH # skip sequence and consistency_level
-        payload = op.substring(verify_vaa.app_args(1), index, verify_vaa.app_args(1).length)
+        payload = op.substring(vaa_body, index, vaa_body.length)
 
         # decode payload, check emitter is known, prevent replays and forward to handler
         self._receive_message(payload, emitter_chain_id, emitter_address, vaa_digest)
 
     @abimethod(readonly=True)
     def manager_role(self) -> Bytes16:
-        return Bytes16.from_bytes(op.extract(op.keccak256(b"MANAGER"), 0, const.BYTES16_LENGTH))
+        # first 16 bytes of keccak256("MANAGER"), precomputed to avoid hashing on every role check
+        return Bytes16.from_bytes(Bytes.from_hex("AF290D8680820AAD922855F39B306097"))
 
     @abimethod(readonly=True)
     def get_wormhole_peer(self, peer_chain_id: UInt16) -> UniversalAddress:
@@ -152,7 +155,7 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
         index += const.BYTES32_LENGTH
         handler_payload_length = op.extract_uint16(payload, index)
         index += const.UINT16_LENGTH
-        handler_payload = op.substring(payload, index, index + handler_payload_length)
+        handler_payload_end = index + handler_payload_length
         # transceiver_payload_length and transceiver_payload are ignored
 
         # check message comes from peer
@@ -161,13 +164,12 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
         # save the vaa digest in storage to protect against replay attacks
         self._set_vaa_consumed(vaa_digest)
 
-        # parse handler payload
-        index = UInt64(0)
-        message_id = MessageId.from_bytes(op.extract(handler_payload, index, const.BYTES32_LENGTH))
+        # parse handler payload in place, the substring fails if it is shorter than its fixed fields or the payload
+        message_id = MessageId.from_bytes(op.extract(payload, index, const.BYTES32_LENGTH))
         index += const.BYTES32_LENGTH
-        message_user_address = UniversalAddress.from_bytes(op.extract(handler_payload, index, const.BYTES32_LENGTH))
+        message_user_address = UniversalAddress.from_bytes(op.extract(payload, index, const.BYTES32_LENGTH))
         index += const.BYTES32_LENGTH
-        message_payload = op.substring(handler_payload, index, handler_payload.length)
+        message_payload = op.substring(payload, index, handler_payload_end)
 
         # deliver message to TransceiverManager
         # IMPORTANT: must verify the recipient chain in the concrete MessageHandler
@@ -195,8 +197,7 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
     def _send_message(self, total_fee: UInt64, message: MessageToSend, transceiver_instruction: Bytes) -> None:
         self._only_initialised()
 
-        # check whether peer chain is registered
-        self.get_wormhole_peer(message.destination_chain_id)
+        # peer chain is already checked to be registered when quoting the fee in send_message
 
         # transceiver_instruction is ignored, when automatic relayer is supported
         # it could be used to signal the relay approach (automatic/manual)
@@ -205,20 +206,21 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
             Bytes.from_hex(WH_TRANSCEIVER_PAYLOAD_PREFIX) +
             message.source_address.bytes +
             message.handler_address.bytes +
-            UInt16(handler_payload.length).bytes +
+            op.extract(op.itob(handler_payload.length), const.UINT64_LENGTH - const.UINT16_LENGTH, const.UINT16_LENGTH) +
             handler_payload +
             UInt16(0).bytes # transceiver payload empty
         )
 
-        # publish message
-        wormhole_core_address, exists = op.AppParamsGet.app_address(self.wormhole_core.value)
+        # publish message, reading wormhole core once as used for both its address and the app call
+        wormhole_core = self.wormhole_core.value
+        wormhole_core_address, exists = op.AppParamsGet.app_address(wormhole_core)
         assert exists, err.WORMHOLE_CORE_ADDRESS_UNKNOWN
 
         payment = itxn.Payment(receiver=wormhole_core_address, amount=total_fee, fee=0)
         app_call = itxn.ApplicationCall(
-            app_id=self.wormhole_core.value,
+            app_id=wormhole_core,
             app_args=(Bytes(b"publishMessage"), payload, op.itob(0)),
-            accounts=(Account(self.emitter_lsig.value.bytes),),
+            accounts=(self.emitter_lsig.value.native,),
             fee=0,
         )
         itxn.submit_txns(payment, app_call)
@@ -231,7 +233,8 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
 
     @subroutine
     def _set_vaa_consumed(self, vaa_digest: VaaDigest) -> None:
-        assert not (Bool(vaa_digest in self.vaas_consumed) and self.vaas_consumed[vaa_digest]), err.VAA_ALREADY_SEEN
+        # only ever set to true so presence is sufficient
+        assert vaa_digest not in self.vaas_consumed, err.VAA_ALREADY_SEEN
         self.vaas_consumed[vaa_digest] = Bool(True)
 
     @subroutine
@@ -252,13 +255,8 @@ class WormholeTransceiver(Transceiver, InitialisableWithCreator):
 
     @subroutine
     def _encode_uvarint(self, val: UInt64) -> Bytes:
-        return self._encode_uvarint_helper(val, Bytes(b""))
-
-    @subroutine
-    def _encode_uvarint_helper(self, val: UInt64, b: Bytes) -> Bytes:
-        return b + (
-            self._encode_uvarint_helper(
-                val >> 7,
-                op.extract(op.itob((val & 255) | 128), 7, 1)
-            ) if val >= 128 else op.extract(op.itob(val & 255), 7, 1)
-        )
+        b = Bytes(b"")
+        while val >= 128:
+            b += op.extract(op.itob((val & 255) | 128), 7, 1)
+            val >>= 7
+        return b + op.extract(op.itob(val & 255), 7, 1)
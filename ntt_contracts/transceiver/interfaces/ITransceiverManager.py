@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 from algopy import ARC4Contract, UInt64, gtxn
 from algopy.arc4 import Address, Bool, DynamicArray, Struct, abimethod
+from typing import Tuple
 
 from ...types import (
     ARC4UInt16,
@@ -185,3 +186,18 @@ class ITransceiverManager(ARC4Contract, ABC):
             Message digest
         """
         pass
+
+    @abstractmethod
+    @abimethod(readonly=True)
+    def calculate_digest_and_attestations(self, message: MessageReceived) -> Tuple[MessageDigest, UInt64]:
+        """Calculate the message digest of the message received and the number of attestations it has received.
+
+        Combines `calculate_message_digest` and `message_attestations` so a message handler only needs a single call.
+
+        Args:
+            message: The message received
+
+        Returns:
+            Tuple of the message digest and the number of attestations from transceivers.
+        """
+        pass
@@ -1,4 +1,4 @@
-from algopy import ARC4Contract, Account, UInt64, itxn
+from algopy import ARC4Contract, UInt64, itxn
 from algopy.arc4 import Address, Bool, abimethod, abi_call
 
 from ...types import TransceiverInstructions, MessageToSend
@@ -27,7 +27,7 @@ class MockMessageHandler(ARC4Contract):
     ) -> None:
         abi_call(
             ITransceiverManager.send_message_to_transceivers,
-            itxn.Payment(amount=fee_payment_amount, receiver=Account(fee_payment_receiver.bytes), fee=0),
+            itxn.Payment(amount=fee_payment_amount, receiver=fee_payment_receiver.native, fee=0),
             message,
             transceiver_instructions,
             app_id=transceiver_manager,
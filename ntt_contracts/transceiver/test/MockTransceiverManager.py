@@ -1,5 +1,6 @@
 from algopy import Bytes, Global, UInt64, gtxn, itxn, op
 from algopy.arc4 import Address, Bool, DynamicArray, UInt256, Struct, abi_call, abimethod, emit
+from typing import Tuple
 
 from folks_contracts.library import BytesUtils
 from ... import errors as err
@@ -162,3 +163,7 @@ class MockTransceiverManager(ITransceiverManager):
     @abimethod(readonly=True)
     def calculate_message_digest(self, message: MessageReceived) -> Bytes32:
         return self._message_digest
+
+    @abimethod(readonly=True)
+    def calculate_digest_and_attestations(self, message: MessageReceived) -> Tuple[Bytes32, UInt64]:
+        return self._message_digest, self._message_attestations
@@ -2519,7 +2519,7 @@ return`;
           args: [messageReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(messageDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Incorrect prefix");
     });
@@ -2547,7 +2547,7 @@ return`;
           args: [messageReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(messageDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Unknown peer chain");
     });
@@ -2575,7 +2575,7 @@ return`;
           args: [messageReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(messageDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Unknown peer address");
     });
@@ -2603,7 +2603,7 @@ return`;
           args: [messageReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(messageDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Invalid target chain");
     });
@@ -2639,7 +2639,7 @@ return`;
           args: [messageReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(messageDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Contract is paused");
 
@@ -2674,7 +2674,7 @@ return`;
       await transceiverManagerClient.send.setMessageDigest({ args: [messageDigest] });
 
       // execute message
-      const APP_MIN_BALANCE = (68_600).microAlgo();
+      const APP_MIN_BALANCE = (68_200).microAlgo();
       const fundingTxn = await localnet.algorand.createTransaction.payment({
         sender: relayer,
         receiver: getApplicationAddress(appId),
@@ -2692,7 +2692,7 @@ return`;
             getBucketBoxKey(inboundBucketId),
             getInboundQueuedTransfersBoxKey(messageDigest),
           ],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         })
         .send();
 
@@ -2737,7 +2737,7 @@ return`;
       await transceiverManagerClient.send.setMessageDigest({ args: [messageDigest] });
 
       // execute message
-      const APP_MIN_BALANCE = (22_900).microAlgo();
+      const APP_MIN_BALANCE = (22_500).microAlgo();
       const fundingTxn = await localnet.algorand.createTransaction.payment({
         sender: relayer,
         receiver: getApplicationAddress(appId),
@@ -2755,12 +2755,12 @@ return`;
             getBucketBoxKey(inboundBucketId),
             getInboundQueuedTransfersBoxKey(messageDigest),
           ],
-          extraFee: (3000).microAlgos(),
+          extraFee: (2000).microAlgos(),
         })
         .send();
 
       // check logs
-      expect(res.confirmations[1].innerTxns![2].logs![0]).toEqual(
+      expect(res.confirmations[1].innerTxns![1].logs![0]).toEqual(
         getEventBytes("Minted(address,uint64)", [user.toString(), untrimmedAmount]),
       );
     });
@@ -2787,7 +2787,7 @@ return`;
       await transceiverManagerClient.send.setMessageDigest({ args: [queuedTransferMessageDigest] });
 
       // execute message
-      const APP_MIN_BALANCE = (68_600).microAlgo();
+      const APP_MIN_BALANCE = (68_200).microAlgo();
       const fundingTxn = await localnet.algorand.createTransaction.payment({
         sender: relayer,
         receiver: getApplicationAddress(appId),
@@ -2805,7 +2805,7 @@ return`;
             getBucketBoxKey(inboundBucketId),
             getInboundQueuedTransfersBoxKey(queuedTransferMessageDigest),
           ],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         })
         .send();
 
@@ -2866,7 +2866,7 @@ return`;
 
       // check refund
       expect(res.confirmations[0].innerTxns!.length).toEqual(2);
-      const APP_MIN_BALANCE = (68_600 - 22_900).microAlgos();
+      const APP_MIN_BALANCE = (68_200 - 22_500).microAlgos();
       expect(res.confirmations[0].innerTxns![1].txn.txn.type).toEqual("pay");
       expect(res.confirmations[0].innerTxns![1].txn.txn.payment!.amount).toEqual(APP_MIN_BALANCE.microAlgo);
       expect(res.confirmations[0].innerTxns![1].txn.txn.payment!.receiver.toString()).toEqual(user.toString());
@@ -262,7 +262,7 @@ describe("MessageHandler", () => {
           args: [MESSAGE_RECEIVED],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(MESSAGE_DIGEST)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Message handler address mismatch");
     });
@@ -289,7 +289,7 @@ describe("MessageHandler", () => {
           args: [MESSAGE_RECEIVED],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(MESSAGE_DIGEST)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Message not approved");
     });
@@ -305,7 +305,7 @@ describe("MessageHandler", () => {
       ).toBeTruthy();
 
       // execute message
-      const APP_MIN_BALANCE = (122_900).microAlgos();
+      const APP_MIN_BALANCE = (122_500).microAlgos();
       const fundingTxn = await localnet.algorand.createTransaction.payment({
         sender: creator,
         receiver: getApplicationAddress(appId),
@@ -323,10 +323,10 @@ describe("MessageHandler", () => {
           args: [MESSAGE_RECEIVED],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(MESSAGE_DIGEST)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         })
         .send();
-      expect(res.confirmations[1].innerTxns!.length).toEqual(2);
+      expect(res.confirmations[1].innerTxns!.length).toEqual(1);
       expect(res.confirmations[1].logs![0]).toEqual(
         getEventBytes("HandledMessage(byte[32],byte[32])", [MESSAGE_DIGEST, MESSAGE_RECEIVED.id]),
       );
@@ -348,7 +348,7 @@ describe("MessageHandler", () => {
           args: [MESSAGE_RECEIVED],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(MESSAGE_DIGEST)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         }),
       ).rejects.toThrow("Message already executed");
     });
@@ -503,7 +503,7 @@ describe("MessageHandler", () => {
       // ═══════════════════════════════════════════════════════════════════
       // STEP 6: VULNERABILITY CONFIRMED - Message executes with 1 attestation
       // ═══════════════════════════════════════════════════════════════════
-      const APP_MIN_BALANCE = (122_900).microAlgos();
+      const APP_MIN_BALANCE = (122_500).microAlgos();
       const fundingTxnAttack = await localnet.algorand.createTransaction.payment({
         sender: creator,
         receiver: getApplicationAddress(appId),
@@ -518,7 +518,7 @@ describe("MessageHandler", () => {
           args: [MESSAGE_RECEIVED],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(USER_MESSAGE_DIGEST)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         })
         .send();
 
@@ -663,7 +663,7 @@ describe("MessageHandler", () => {
       const fundingTxn = await localnet.algorand.createTransaction.payment({
         sender: creator,
         receiver: getApplicationAddress(appId),
-        amount: (122_900).microAlgos(),
+        amount: (122_500).microAlgos(),
       });
 
       await client
@@ -674,7 +674,7 @@ describe("MessageHandler", () => {
           args: [highValueReceived],
           appReferences: [transceiverManagerAppId],
           boxReferences: [getMessagesExecutedBoxKey(highValueDigest)],
-          extraFee: (2000).microAlgos(),
+          extraFee: (1000).microAlgos(),
         })
         .send();
 
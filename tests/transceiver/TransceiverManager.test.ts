@@ -145,7 +145,6 @@ describe("TransceiverManager", () => {
     client = appClient;
 
     expect(appId).not.toEqual(0n);
-    expect(await client.state.global.maxTransceivers()).toEqual(MAX_TRANSCEIVERS);
     expect(Uint8Array.from(await client.defaultAdminRole())).toEqual(DEFAULT_ADMIN_ROLE);
     expect(Uint8Array.from(await client.getRoleAdmin({ args: [DEFAULT_ADMIN_ROLE] }))).toEqual(DEFAULT_ADMIN_ROLE);
   });
@@ -177,6 +176,26 @@ describe("TransceiverManager", () => {
     expect(await client.calculateMessageDigest({ args: [message] })).toEqual(messageDigest);
   });
 
+  test("calculate digest and attestations returns zero attestations when message handler is unknown", async () => {
+    expect(await client.isMessageHandlerKnown({ args: [appId] })).toBeFalsy();
+    const message = getMessageReceived(
+      getRandomUInt(MAX_UINT16),
+      getRandomMessageToSend({ handlerAddress: convertNumberToBytes(appId, 32) }),
+    );
+    const messageDigest = calculateMessageDigest(message);
+    expect(await client.calculateDigestAndAttestations({ args: [message] })).toEqual([messageDigest, 0n]);
+  });
+
+  test("calculate digest and attestations returns zero attestations when message not attested", async () => {
+    const message = getMessageReceived(
+      getRandomUInt(MAX_UINT16),
+      getRandomMessageToSend({ handlerAddress: convertNumberToBytes(messageHandlerAppId, 32) }),
+    );
+    const messageDigest = calculateMessageDigest(message);
+    expect(await client.messageAttestations({ args: [messageDigest] })).toEqual(0n);
+    expect(await client.calculateDigestAndAttestations({ args: [message] })).toEqual([messageDigest, 0n]);
+  });
+
   test("get handler transceivers fails when message handler unknown", async () => {
     expect(await client.isMessageHandlerKnown({ args: [messageHandlerAppId] })).toBeFalsy();
     await expect(client.getHandlerTransceivers({ sender: user, args: [messageHandlerAppId] })).rejects.toThrow(
@@ -1145,6 +1164,23 @@ describe("TransceiverManager", () => {
       ).rejects.toThrow("Message handler unknown");
     });
 
+    test("fails when message handler address has non-zero prefix", async () => {
+      const added = await client.getHandlerTransceivers({ args: [messageHandlerAppId] });
+      const transceiverAppId = added[0];
+      const handlerAddress = convertNumberToBytes(messageHandlerAppId, 32);
+      handlerAddress[0] = 1;
+      const messageReceived = getMessageReceived(getRandomUInt(MAX_UINT16), getRandomMessageToSend({ handlerAddress }));
+      await expect(
+        transceiverFactory.getAppClientById({ appId: transceiverAppId }).send.deliverMessage({
+          sender: user,
+          args: [messageReceived],
+          appReferences: [appId],
+          boxReferences: [getHandlerTransceiversBoxKey(messageHandlerAppId)],
+          extraFee: (1000).microAlgos(),
+        }),
+      ).rejects.toThrow();
+    });
+
     test("fails when caller is not configured transceiver", async () => {
       // check not added
       const transceiverAppId = transceiverAppIds[Number(MAX_TRANSCEIVERS)];
@@ -1289,5 +1325,18 @@ describe("TransceiverManager", () => {
         }),
       ).rejects.toThrow("Attestation already received");
     });
+
+    test("calculate digest and attestations returns number of transceivers which have attested", async () => {
+      const added = await client.getHandlerTransceivers({ args: [messageHandlerAppId] });
+      let numAttested = 0n;
+      for (const transceiverAppId of added) {
+        if (await client.hasTransceiverAttested({ args: [messageDigest, transceiverAppId] })) numAttested++;
+      }
+      expect(numAttested).toEqual(2n);
+      expect(await client.calculateDigestAndAttestations({ args: [messageReceived] })).toEqual([
+        messageDigest,
+        numAttested,
+      ]);
+    });
   });
 });
@@ -47,7 +47,7 @@ export function getOutboundBucketIdBytes(): Uint8Array {
 }
 
 export function useMessageId(sequence: number | bigint): Uint8Array {
-  return keccak_256(convertNumberToBytes(BigInt(sequence) + 1n, 8));
+  return convertNumberToBytes(BigInt(sequence) + 1n, 32);
 }
 
 export function getArc4Signature(signature: string): Uint8Array {